@@ -0,0 +1,93 @@
+"""Benchmark the plugin discovery of the rig plugins.
+
+Run it with Blender, so `bpy` is available:
+
+    blender -b --python-exit-code 1 --python benchmarks/discover_rig.py
+
+Discovering the plugins should not import stalker (or SQLAlchemy) nor
+register any operators, and should cost the same every time it is repeated.
+It also prints what discovery would cost with the old eager stalker import
+and operator registration, for comparison.
+"""
+
+import pathlib
+import sys
+import time
+
+
+import pyblish.api
+import bpy
+
+
+RUNS = 30
+# Allowed slowdown of the last discoveries compared to the first ones.
+TOLERANCE = 1.2
+PLUGIN_PATH = pathlib.Path(__file__).resolve().parent.parent / 'pyblish_blender_plugins' / 'rig'
+HEAVY_MODULES = ('stalker', 'sqlalchemy')
+
+
+def timed(func, *args, **kwargs):
+    """Call the function and return its result and the time it took in ms"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def discover():
+    """Discover the rig plugins and return the time it took in ms"""
+    plugins, duration = timed(pyblish.api.discover, paths=[str(PLUGIN_PATH)])
+    assert plugins, "No plugins found in %s" % PLUGIN_PATH
+    return duration
+
+
+def main():
+    # The first discovery warms up pyblish itself, leave it out.
+    discover()
+    timings = [discover() for _ in range(RUNS)]
+    for i, timing in enumerate(timings, 1):
+        print("Run {0:2d}: {1:8.2f} ms".format(i, timing))
+
+    imported = [m for m in HEAVY_MODULES if m in sys.modules]
+    assert not imported, "Discovery imported %s" % ", ".join(imported)
+    assert not hasattr(bpy.types, 'PYBLISH_OT_objects_parent_set'), \
+        "Discovery registered the pyblish operators"
+
+    third = RUNS // 3
+    first = median(timings[:third])
+    last = median(timings[-third:])
+    lazy = median(timings)
+    print("First runs median: %.2f ms, last runs median: %.2f ms" % (first, last))
+    assert last <= first * TOLERANCE, "Discovery got slower: %.2f ms -> %.2f ms" % (first, last)
+
+    # What discovery used to cost on top of this: importing stalker at module
+    # level and registering the operators as a side effect.
+    plugins = {p.__name__: p for p in pyblish.api.discover(paths=[str(PLUGIN_PATH)])}
+    # Discovered modules are not in sys.modules, get to them through a plugin.
+    validate_rig = plugins['IsNotParented'].process.__globals__
+    try:
+        _, stalker_import = timed(__import__, 'stalker')
+    except ImportError:
+        stalker_import = 0.0
+        print("stalker is not installed, the eager baseline leaves it out")
+    registration = timed(validate_rig['register'])[1]
+    print("Lazy discovery: %.2f ms" % lazy)
+    print("Eager baseline: %.2f ms (+ %.2f ms stalker import, + %.2f ms registration)"
+          % (lazy + stalker_import + registration, stalker_import, registration))
+
+    # Registering again, also from a rediscovered module, is a no-op.
+    plugins = {p.__name__: p for p in pyblish.api.discover(paths=[str(PLUGIN_PATH)])}
+    rediscovered = plugins['IsNotParented'].process.__globals__
+    rediscovered['register']()
+    assert bpy.types.PYBLISH_OT_objects_parent_set is validate_rig['ParentObjects'], \
+        "Registering again replaced the registered operator"
+    rediscovered['unregister']()
+    assert not hasattr(bpy.types, 'PYBLISH_OT_objects_parent_set'), \
+        "The pyblish operators are still registered"
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,6 @@
 """Collect a rig in the open file."""
 
 import pyblish.api
-from stalker import db, Task
 import bpy
 import logging
 
@@ -61,6 +60,9 @@ class CollectRig(pyblish.api.ContextPlugin):
         if not task_id or task_id == "-1":
             self.log.warning("The task is not set. Is this a valid production file?")
             return
+        # Import stalker (and SQLAlchemy with it) only when actually
+        # processing, so plugin discovery stays cheap.
+        from stalker import db, Task
         db.setup()
         task = Task.query.filter_by(id=task_id).first()
         if not task:
@@ -51,7 +51,16 @@ class ExtractRig(pyblish.api.InstancePlugin):
         render_settings['fps_base'] = scene.render.fps_base
         children = [c.name for c in instance.data('children')]
 
+        # When the widgets are published to the shared library, link them
+        # from there instead of embedding a copy in the rig.
+        widget_library = instance.data('widgetLibrary')
+        widgets = []
+        if widget_library:
+            widgets = [w.name for w in instance.data('widgets')]
+
         for obj in instance:
+            if obj.name in widgets:
+                continue
             groups.update({*obj.users_group})
             objects.add(obj)
             layers[obj.name] = list(obj.layers)
@@ -63,16 +72,34 @@ class ExtractRig(pyblish.api.InstancePlugin):
         python_file = temp_dir / ".".join((name, "py"))
         python_expression = [
             "import bpy",
+            "import sys",
             "layers = {0}".format(layers),
             "scene_settings = {0}".format(scene_settings),
             "render_settings = {0}".format(render_settings),
             "children = {0}".format(children),
+            "widgets = {0}".format(widgets),
+            "widget_source = {0!r}".format(instance.data('widgetSource')),
+            "widget_library = {0!r}".format(widget_library),
+            "if widgets:",
+            "    with bpy.data.libraries.load(widget_source, link=True) as (data_from, data_to):",
+            "        data_to.objects = [w for w in data_from.objects if w in widgets]",
+            "    missing = set(widgets) - {o.name for o in data_to.objects if o is not None}",
+            "    if missing:",
+            "        print('Widgets %s not found in %s' % (', '.join(sorted(missing)), widget_source), file=sys.stderr)",
+            "        sys.exit(1)",
+            "    for linked in data_to.objects:",
+            "        for local in [o for o in bpy.data.objects if o.library is None and o.name == linked.name]:",
+            "            local.user_remap(linked)",
+            "            bpy.data.objects.remove(local)",
+            "        linked.library.filepath = widget_library",
             "scene = bpy.data.scenes[0]",
             "for k, v in scene_settings.items():",
             "    setattr(scene, k, v)",
             "for k, v in render_settings.items():",
             "    setattr(scene.render, k, v)",
             "for obj in bpy.data.objects:",
+            "    if obj.library:",
+            "        continue",
             "    scene.objects.link(obj)",
             "    obj.layers = layers[obj.name]",
             "    if obj.name in children:",
@@ -81,7 +108,8 @@ class ExtractRig(pyblish.api.InstancePlugin):
         ]
         with open(str(python_file), "w") as script_file:
             script_file.write("\n".join(python_expression))
-        cmd = [bpy.app.binary_path, "-b", str(temp_file), "--python", str(python_file)]
+        cmd = [bpy.app.binary_path, "-b", str(temp_file), "--python-exit-code", "1",
+               "--python", str(python_file)]
 
         self.log.info("Exporting %s to %s" % (instance, temp_file))
         subprocess.run(cmd, check=True)
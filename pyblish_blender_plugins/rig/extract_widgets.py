@@ -0,0 +1,131 @@
+"""Extract the rig widgets to a shared library."""
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+
+
+import pyblish.api
+import bpy
+
+
+def _hash_values(sha, *values):
+    """Add the representation of the values to the hash"""
+    for value in values:
+        if isinstance(value, float):
+            value = round(value, 6)
+        elif hasattr(value, '__len__') and not isinstance(value, str):
+            value = tuple(round(v, 6) if isinstance(v, float) else v for v in value)
+        sha.update(repr(value).encode())
+
+
+def get_widgets_hash(widgets):
+    """Get a hash of the name and shape of the widgets
+
+    Returns None if a widget has modifiers or is of a type whose shape can't
+    be hashed.
+    """
+    sha = hashlib.sha1()
+    for widget in sorted(widgets, key=lambda w: w.name):
+        if widget.modifiers:
+            return None
+        _hash_values(sha, widget.name, widget.type)
+        if widget.type == 'MESH':
+            mesh = widget.data
+            _hash_values(sha, mesh.show_double_sided, mesh.use_auto_smooth, mesh.auto_smooth_angle)
+            for vertex in mesh.vertices:
+                _hash_values(sha, vertex.co)
+            for edge in mesh.edges:
+                _hash_values(sha, edge.vertices, edge.use_edge_sharp)
+            for polygon in mesh.polygons:
+                _hash_values(sha, polygon.vertices, polygon.use_smooth)
+        elif widget.type == 'CURVE':
+            curve = widget.data
+            _hash_values(sha, curve.dimensions, curve.resolution_u, curve.fill_mode,
+                         curve.bevel_depth, curve.bevel_resolution, curve.extrude, curve.offset)
+            for spline in curve.splines:
+                _hash_values(sha, spline.type, spline.use_cyclic_u, spline.resolution_u, spline.order_u)
+                for point in spline.bezier_points:
+                    _hash_values(sha, point.co, point.handle_left, point.handle_right)
+                for point in spline.points:
+                    _hash_values(sha, point.co)
+        elif widget.type == 'EMPTY':
+            _hash_values(sha, widget.empty_draw_type, widget.empty_draw_size)
+        else:
+            return None
+    return sha.hexdigest()
+
+
+class ExtractWidgets(pyblish.api.InstancePlugin):
+    """Serialise the rig widgets once into a shared, versioned library
+
+    Rigs with the same widgets share the same library version, the rig itself
+    links the widgets instead of embedding them.
+    """
+
+    order = pyblish.api.ExtractorOrder - 0.1
+    families = ['Rig']
+    hosts = ['blender']
+    label = "Extract Shared Widgets"
+    optional = True
+
+    def process(self, instance):
+        widgets = instance.data('widgets')
+        if not widgets:
+            self.log.info("No widgets to extract")
+            return
+
+        context = instance.context
+        public = pathlib.Path(context.data('currentFile')).parent / 'public'
+        root = pathlib.Path(os.environ.get('PYBLISH_WIDGET_LIBRARY', str(public / 'widgets')))
+        manifest_file = root / 'widgets.json'
+        manifest = dict()
+        if manifest_file.is_file():
+            with open(str(manifest_file)) as f:
+                manifest = json.load(f)
+        # Libraries that are being published in this session, but are not
+        # integrated yet: {hash: (filename, temp file)}
+        pending = context.data('widgetLibraries') or dict()
+
+        widgets_hash = get_widgets_hash(widgets)
+        if widgets_hash is None:
+            self.log.warning("Can't compare widgets with modifiers or of this type, "
+                             "they will be embedded in the rig")
+            return
+
+        filename = manifest.get(widgets_hash)
+        if widgets_hash in pending:
+            filename, source = pending[widgets_hash]
+            self.log.info("Widgets are already extracted to %s" % source)
+            instance.set_data('widgetTempFile', source)
+        elif filename and (root / filename).is_file():
+            self.log.info("Widgets are already published in %s" % (root / filename))
+            source = str(root / filename)
+        else:
+            pattern = re.compile(r"widgets_v(?P<version>\d+)\.blend$")
+            filenames = {f.name for f in root.glob("widgets_v*.blend")}
+            filenames.update(f for f, _ in pending.values())
+            versions = [int(m.group('version')) for m in map(pattern.match, filenames) if m]
+            version = max(versions, default=0) + 1
+            filename = "widgets_v{version:03d}.blend".format(version=version)
+            source = str(pathlib.Path(bpy.app.tempdir) / filename)
+            self.log.info("Writing temp widget library %s" % source)
+            bpy.data.libraries.write(source, set(widgets), fake_user=True)
+            instance.set_data('widgetTempFile', source)
+            pending[widgets_hash] = (filename, source)
+            context.set_data('widgetLibraries', pending)
+
+        instance.set_data('widgetHash', widgets_hash)
+        instance.set_data('widgetSource', source)
+        library_file = root / filename
+        instance.set_data('widgetLibraryFile', str(library_file))
+        # Only link relative to the public rig when the library lives next to
+        # it, otherwise (a shared location or another drive) use the full path.
+        try:
+            library_file.relative_to(public)
+            library = bpy.path.relpath(str(library_file), start=str(public))
+        except ValueError:
+            library = os.path.abspath(str(library_file))
+        instance.set_data('widgetLibrary', library)
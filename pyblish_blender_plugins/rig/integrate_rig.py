@@ -19,6 +19,10 @@ class IntegrateRig(pyblish.api.InstancePlugin):
 
     def process(self, instance):
         assert instance.data('tempFile'), 'Can\'t find rig on disk, aborting...'
+        widget_library = instance.data('widgetLibraryFile')
+        if widget_library:
+            assert pathlib.Path(widget_library).is_file(), \
+                'Can\'t find widget library %s, aborting...' % widget_library
 
         self.log.info('Computing output directory...')
         context = instance.context
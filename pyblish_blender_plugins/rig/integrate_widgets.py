@@ -0,0 +1,91 @@
+"""Integrate the rig widgets into the shared library."""
+
+import contextlib
+import json
+import os
+import pathlib
+import shutil
+import time
+
+
+import pyblish.api
+
+
+LOCK_TIMEOUT = 60
+
+
+@contextlib.contextmanager
+def lock_library(root, timeout=LOCK_TIMEOUT):
+    """Lock the widget library for other publishes while updating it"""
+    lock_file = root / 'widgets.lock'
+    start = time.time()
+    while True:
+        try:
+            fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.time() - start > timeout:
+                raise RuntimeError("Could not lock the widget library, remove %s if no one "
+                                   "else is publishing" % lock_file)
+            time.sleep(0.5)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(str(lock_file))
+
+
+def read_manifest(manifest_file):
+    """Read the widget library manifest {hash: filename}"""
+    if not manifest_file.is_file():
+        return dict()
+    with open(str(manifest_file)) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest_file, manifest):
+    """Replace the manifest at once, so readers never see a partial file"""
+    temp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(str(temp_file), 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    os.replace(str(temp_file), str(manifest_file))
+
+
+class IntegrateWidgets(pyblish.api.InstancePlugin):
+    """Copy new widget libraries to the shared location
+
+    The extracted rig links this library, so it is not optional. It is still
+    integrated when IntegrateRig is switched off, in which case the library
+    is simply not used (yet).
+    """
+
+    order = pyblish.api.IntegratorOrder - 0.1
+    families = ['Rig']
+    label = "Integrate Shared Widgets"
+
+    def process(self, instance):
+        src = instance.data('widgetTempFile')
+        if not src:
+            self.log.info("No new widget library to integrate")
+            return
+
+        dst = pathlib.Path(instance.data('widgetLibraryFile'))
+        root = dst.parent
+        if not root.is_dir():
+            root.mkdir(parents=True)
+        widgets_hash = instance.data('widgetHash')
+
+        with lock_library(root):
+            manifest_file = root / 'widgets.json'
+            manifest = read_manifest(manifest_file)
+            if dst.is_file():
+                if manifest.get(widgets_hash) != dst.name:
+                    raise RuntimeError("%s already exists with different widgets, please publish again" % dst)
+                self.log.info("%s is already integrated" % dst)
+            else:
+                self.log.info('Copying %s to %s...' % (src, dst))
+                shutil.copy2(src, str(dst))
+                self.log.info('Copied successfully!')
+
+            manifest[widgets_hash] = dst.name
+            write_manifest(manifest_file, manifest)
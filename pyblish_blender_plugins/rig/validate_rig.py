@@ -186,6 +186,7 @@ class UnparentRig(pyblish.api.Action):
                 instance = result['instance']
                 armature = instance.data('armature')
                 if armature.parent:
+                    register()
                     bpy.ops.pyblish.object_parent_clear(True, objects=armature.name)
                     self.log.info("Unparented armature %s" % armature.name)
 
@@ -222,6 +223,7 @@ class ParentModifierChildren(pyblish.api.Action):
                 armature = instance.data('armature')
                 objects = {c for c in bpy.data.objects if c.find_armature() == armature}
                 objects = {c.name for c in objects if c.parent != armature}
+                register()
                 bpy.ops.pyblish.objects_parent_set(True, parent=armature.name, objects=";".join(objects))
                 self.log.info("%s are now parented under %s" % (", ".join(objects), armature.name))
 
@@ -242,6 +244,7 @@ class GroupChildren(pyblish.api.Action):
                     return
                 group = armature.users_group[0]
                 objects = {c.name for c in instance.data('children') if c not in group.objects.values()}
+                register()
                 bpy.ops.pyblish.group_objects_add(True, group=group.name, objects=";".join(objects))
                 if len(objects) == 1:
                     word = "is"
@@ -266,6 +269,7 @@ class UngroupWidgets(pyblish.api.Action):
                     return
                 group = armature.users_group[0]
                 objects = {w.name for w in instance.data('widgets') if w in group.objects.values()}
+                register()
                 bpy.ops.pyblish.group_objects_remove(True, group=group.name, objects=";".join(objects))
                 if len(objects) == 1:
                     word = "is"
@@ -286,6 +290,7 @@ class RemoveAnimation(pyblish.api.Action):
             if result['error'] and plugin == result['plugin']:
                 instance = result['instance']
                 objects = {o.name for o in instance if o.animation_data and o.animation_data.action}
+                register()
                 bpy.ops.pyblish.animation_data_clear(True, objects=";".join(objects))
                 self.log.info("Removed animation data from %s" % ", ".join(objects))
 
@@ -310,6 +315,7 @@ class ResetTransforms(pyblish.api.Action):
                     if pose_bone.matrix_basis != identity_matrix:
                         objects.add(armature.name)
                 if objects:
+                    register()
                     bpy.ops.pyblish.transforms_clear(True, objects=";".join(objects))
                     self.log.info("Transformations of %s are reset" % armature.name)
 
@@ -443,9 +449,36 @@ class NoTransforms(pyblish.api.InstancePlugin):
                 raise ValueError("%s should be in rest position (no posed bones)" % armature.name)
 
 
-bpy.utils.register_class(AddObjectsToGroup)
-bpy.utils.register_class(ParentObjects)
-bpy.utils.register_class(UnparentObjects)
-bpy.utils.register_class(RemoveObjectsFromGroup)
-bpy.utils.register_class(AnimationClear)
-bpy.utils.register_class(TransformsClear)
+classes = (
+    AddObjectsToGroup,
+    ParentObjects,
+    UnparentObjects,
+    RemoveObjectsFromGroup,
+    AnimationClear,
+    TransformsClear,
+)
+
+
+def get_type_name(cls):
+    """Get the name of the operator in `bpy.types` (e.g. 'PYBLISH_OT_transforms_clear')"""
+    module, name = cls.bl_idname.split('.')
+    return "{0}_OT_{1}".format(module.upper(), name)
+
+
+def register():
+    """Register the operators used by the actions (safe to call repeatedly)
+
+    Plugin discovery executes this module again and creates new classes, so
+    check the registered operators by name instead of by class.
+    """
+    for cls in classes:
+        if not hasattr(bpy.types, get_type_name(cls)):
+            bpy.utils.register_class(cls)
+
+
+def unregister():
+    """Unregister the operators used by the actions, e.g. when the host shuts down"""
+    for cls in reversed(classes):
+        registered = getattr(bpy.types, get_type_name(cls), None)
+        if registered is not None:
+            bpy.utils.unregister_class(registered)